@@ -23,7 +23,7 @@ except ImportError as exc:
 
 
 def read_samples(csv_path: Path):
-    """Return list of (datanodes, total_blocks, blocks_per_dn, memory_bytes)."""
+    """Return an (N, 4) int64 array of (datanodes, total_blocks, blocks_per_dn, memory_bytes)."""
     samples = []
     with csv_path.open() as f:
         reader = csv.DictReader(f)
@@ -36,16 +36,16 @@ def read_samples(csv_path: Path):
             except (ValueError, KeyError):
                 continue
             samples.append((dn, total, per_dn, mem))
-    samples.sort(key=lambda x: x[0])
-    return samples
+    samples = np.array(samples, dtype=np.int64).reshape(-1, 4)
+    return samples[np.argsort(samples[:, 0], kind="stable")]
 
 
 def plot_memory_vs_datanodes(samples, output_path: Path, log_y: bool):
     """Memory (MiB) vs DataNode count, annotated with blocks/DN."""
-    dns = [s[0] for s in samples]
-    mem_mib = [s[3] / (1024 * 1024) for s in samples]
-    per_dn = [s[2] for s in samples]
-    total_blocks = samples[0][1] if samples else 0
+    dns = samples[:, 0]
+    mem_mib = samples[:, 3] / (1024 * 1024)
+    per_dn = samples[:, 2]
+    total_blocks = samples[0, 1] if len(samples) else 0
 
     fig, ax1 = plt.subplots(figsize=(11, 6))
 
@@ -84,10 +84,10 @@ def plot_memory_vs_datanodes(samples, output_path: Path, log_y: bool):
 
 def plot_memory_vs_blocks_per_dn(samples, output_path: Path, log_y: bool):
     """Memory vs blocks-per-DataNode (inverse relationship expected)."""
-    per_dn = [s[2] for s in samples]
-    mem_mib = [s[3] / (1024 * 1024) for s in samples]
-    dns = [s[0] for s in samples]
-    total_blocks = samples[0][1] if samples else 0
+    per_dn = samples[:, 2]
+    mem_mib = samples[:, 3] / (1024 * 1024)
+    dns = samples[:, 0]
+    total_blocks = samples[0, 1] if len(samples) else 0
 
     plt.figure(figsize=(10, 6))
     plt.plot(per_dn, mem_mib, marker="o", linewidth=2, color="teal")
@@ -126,7 +126,7 @@ def main():
     args = parser.parse_args()
 
     samples = read_samples(args.csv)
-    if not samples:
+    if len(samples) == 0:
         raise SystemExit(f"No data found in {args.csv}")
 
     base = args.output or args.csv.parent / "fixed_blocks"
@@ -1,30 +1,25 @@
 """Plot MiniDFSCluster memory usage samples produced by MiniDFSClusterExperiment."""
 
 import argparse
-import csv
 from pathlib import Path
 
 try:
+    import matplotlib
+    matplotlib.use("Agg")  # figures are only saved to disk
     import matplotlib.pyplot as plt
+    import numpy as np
+    import pandas as pd
 except ImportError as exc:
-    raise SystemExit("matplotlib is required to generate the plot. Install it with `pip install matplotlib`." ) from exc
+    raise SystemExit("matplotlib, numpy and pandas are required to generate the plot. Install them with `pip install matplotlib numpy pandas`." ) from exc
 
 
 def read_samples(csv_path: Path):
-    samples = []
-    with csv_path.open() as csvfile:
-        reader = csv.reader(csvfile)
-        header = next(reader, None)
-        for row in reader:
-            if not row or len(row) < 2:
-                continue
-            try:
-                nodes = int(row[0])
-                memory = int(row[1])
-            except ValueError:
-                continue
-            samples.append((nodes, memory))
-    return samples
+    """Return (nodes, memory) int64 arrays sorted by node count, skipping malformed rows."""
+    # pandas' C parser does the splitting; short or non-integer rows become NaN and are dropped
+    data = pd.read_csv(csv_path, usecols=[0, 1]).apply(pd.to_numeric, errors="coerce").dropna()
+    nodes, memory = data[(data % 1 == 0).all(axis=1)].to_numpy(dtype=np.int64).T
+    order = np.argsort(nodes, kind="stable")
+    return nodes[order], memory[order]
 
 
 def main():
@@ -44,15 +39,25 @@ def main():
         action="store_true",
         help="Use a logarithmic scale for the memory axis.",
     )
+    parser.add_argument(
+        "--skip-unchanged",
+        action="store_true",
+        help="Keep an existing figure that is newer than both the CSV and this script. "
+        "Other options (e.g. --log-y) are not compared, so only use this when they are unchanged.",
+    )
     args = parser.parse_args()
 
-    samples = read_samples(args.csv)
-    if not samples:
+    if args.skip_unchanged and args.output.exists():
+        output_mtime = args.output.stat().st_mtime
+        if output_mtime > args.csv.stat().st_mtime and output_mtime > Path(__file__).stat().st_mtime:
+            print(f"{args.output} is up to date, skipping (drop --skip-unchanged to regenerate)")
+            return
+
+    nodes, memory = read_samples(args.csv)
+    if nodes.size == 0:
         raise SystemExit(f"No data found in {args.csv}")
 
-    samples.sort(key=lambda item: item[0])
-    nodes, memory = zip(*samples)
-    memory_mib = [value / (1024 * 1024) for value in memory]
+    memory_mib = memory / (1024 * 1024)
 
     plt.figure(figsize=(10, 6))
     plt.plot(nodes, memory_mib, marker="o", linewidth=2)
@@ -6,22 +6,44 @@ DESCRIPTION: Unified plotting for storage virtualization experiments.
              - Block scaling (NameNode memory vs block count)
              - Storage directory scaling (throughput vs storage dirs)
              - Memory over time monitoring
-USAGE: python3 plot-storage-virtualization.py <csv_file> [output_dir]
+USAGE: python3 plot-storage-virtualization.py [--skip-unchanged] <csv_file>... [output_dir]
+       With --skip-unchanged, plots newer than both their CSV and this script
+       are kept instead of being re-rendered. When several CSVs are given,
+       each one's plots are named <csv_stem>_<type>_results.png.
 """
 
 import sys
 import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 
-try:
-    import pandas as pd
-    import matplotlib.pyplot as plt
-    import matplotlib.ticker as ticker
-    import numpy as np
-except ImportError as e:
-    print(f"Missing required library: {e}")
-    print("Install with: pip install matplotlib pandas numpy")
-    sys.exit(1)
+
+def _lazy_imports():
+    """Import the plotting libraries, deferred so usage errors exit quickly."""
+    global pd, plt, ticker, np
+    try:
+        import pandas as pd
+        import matplotlib
+        matplotlib.use('Agg')  # figures are only saved to disk
+        import matplotlib.pyplot as plt
+        import matplotlib.ticker as ticker
+        import numpy as np
+    except ImportError as e:
+        print(f"Missing required library: {e}")
+        print("Install with: pip install matplotlib pandas numpy")
+        sys.exit(1)
+
+
+# Columns each experiment's plots read; anything else in the CSV is skipped
+# at parse time.
+PLOT_COLUMNS = {
+    'storage_dirs': {'num_dirs', 'write_throughput_mbps', 'read_throughput_mbps',
+                     'block_report_ms', 'namenode_heap_mb'},
+    'block_scaling': {'actual_blocks', 'heap_mb', 'heap_delta_mb',
+                      'ls_latency_ms', 'fsck_latency_ms'},
+    'memory_monitor': {'timestamp', 'heap_used_mb', 'heap_pct', 'block_count'},
+}
 
 
 def detect_experiment_type(df):
@@ -38,15 +60,66 @@ def detect_experiment_type(df):
         return 'unknown'
 
 
-def plot_storage_dirs(df, output_dir):
+def is_up_to_date(output_file, csv_file):
+    """Return True if output_file exists and is newer than csv_file and this script."""
+    if not output_file.exists():
+        return False
+    output_mtime = output_file.stat().st_mtime
+    return (output_mtime > csv_file.stat().st_mtime
+            and output_mtime > Path(__file__).stat().st_mtime)
+
+
+def read_csv_cached(csv_file, columns):
+    """Read the given columns of csv_file, via a Feather sidecar when it is current.
+
+    The sidecar (Arrow IPC) is written next to the CSV on the first read and
+    reused while it is newer than both the CSV and this script, since an edit
+    to PLOT_COLUMNS changes which columns it should hold. Feather support
+    needs pyarrow; without it this is a plain pd.read_csv.
+    """
+    feather_file = csv_file.with_suffix('.feather')
+    if is_up_to_date(feather_file, csv_file):
+        try:
+            return pd.read_feather(feather_file)
+        except (ImportError, OSError, ValueError):
+            pass  # no pyarrow or unreadable sidecar: fall back to the CSV
+    
+    df = pd.read_csv(csv_file, usecols=lambda column: column in columns)
+    # Write to a temporary name and rename, so an interrupted write never
+    # leaves a truncated sidecar in place
+    tmp_file = feather_file.with_name(f"{feather_file.name}.{os.getpid()}.tmp")
+    try:
+        df.to_feather(tmp_file)
+        os.replace(tmp_file, feather_file)
+    except (ImportError, OSError):
+        pass  # caching is best-effort
+    finally:
+        tmp_file.unlink(missing_ok=True)
+    return df
+
+
+def save_figure(fig, output_file, pdf_file=None):
+    """Save fig as PNG (and optionally PDF); constrained layout already fits it."""
+    fig.savefig(output_file, dpi=150)
+    print(f"Plot saved to: {output_file}")
+    if pdf_file is not None:
+        fig.savefig(pdf_file)
+
+
+def plot_storage_dirs(df, output_dir, prefix=''):
     """Plot storage directory scaling results."""
-    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+    fig, axes = plt.subplots(2, 2, figsize=(14, 10), constrained_layout=True)
+    
+    num_dirs = df['num_dirs'].to_numpy()
+    write_tp = df['write_throughput_mbps'].to_numpy()
+    read_tp = df['read_throughput_mbps'].to_numpy()
+    block_report = df['block_report_ms'].to_numpy()
     
     # Plot 1: Throughput vs Storage Dirs
     ax1 = axes[0, 0]
-    ax1.plot(df['num_dirs'], df['write_throughput_mbps'], 'o-', 
+    ax1.plot(num_dirs, write_tp, 'o-', 
              label='Write', color='#2E86AB', linewidth=2, markersize=8)
-    ax1.plot(df['num_dirs'], df['read_throughput_mbps'], 's-', 
+    ax1.plot(num_dirs, read_tp, 's-', 
              label='Read', color='#E94F37', linewidth=2, markersize=8)
     ax1.set_xlabel('Number of Storage Directories')
     ax1.set_ylabel('Throughput (MB/s)')
@@ -57,17 +130,17 @@ def plot_storage_dirs(df, output_dir):
     
     # Plot 2: Block Report Time
     ax2 = axes[0, 1]
-    ax2.bar(range(len(df)), df['block_report_ms'], color='#4ECDC4')
+    ax2.bar(range(len(df)), block_report, color='#4ECDC4')
     ax2.set_xlabel('Number of Storage Directories')
     ax2.set_ylabel('Block Report Time (ms)')
     ax2.set_title('Block Report Latency vs Virtual Storage Units')
     ax2.set_xticks(range(len(df)))
-    ax2.set_xticklabels(df['num_dirs'])
+    ax2.set_xticklabels(num_dirs)
     ax2.grid(True, alpha=0.3, axis='y')
     
     # Plot 3: NameNode Heap
     ax3 = axes[1, 0]
-    ax3.plot(df['num_dirs'], df['namenode_heap_mb'], 'o-', 
+    ax3.plot(num_dirs, df['namenode_heap_mb'].to_numpy(), 'o-', 
              color='#9B59B6', linewidth=2, markersize=8)
     ax3.set_xlabel('Number of Storage Directories')
     ax3.set_ylabel('NameNode Heap (MB)')
@@ -81,46 +154,46 @@ def plot_storage_dirs(df, output_dir):
     
     # Find optimal configuration
     if 'write_throughput_mbps' in df.columns:
-        optimal_idx = df['write_throughput_mbps'].idxmax()
-        optimal = df.loc[optimal_idx]
+        # nanargmax skips missing measurements, like idxmax did
+        best = int(np.nanargmax(write_tp))
         
         summary_text = f"""
         Storage Directory Scaling Summary
         ─────────────────────────────────
         
         Tested configurations: {len(df)}
-        Storage dirs range: {df['num_dirs'].min()} to {df['num_dirs'].max()}
+        Storage dirs range: {num_dirs.min()} to {num_dirs.max()}
         
         Optimal Configuration:
-        • Storage directories: {int(optimal['num_dirs'])}
-        • Write throughput: {optimal['write_throughput_mbps']:.1f} MB/s
-        • Read throughput: {optimal['read_throughput_mbps']:.1f} MB/s
-        • Block report time: {optimal['block_report_ms']:.1f} ms
+        • Storage directories: {int(num_dirs[best])}
+        • Write throughput: {write_tp[best]:.1f} MB/s
+        • Read throughput: {read_tp[best]:.1f} MB/s
+        • Block report time: {block_report[best]:.1f} ms
         
         Scaling Behavior:
-        • Write throughput change: {(df['write_throughput_mbps'].iloc[-1] / df['write_throughput_mbps'].iloc[0] - 1) * 100:.1f}%
-        • Block report change: {(df['block_report_ms'].iloc[-1] / df['block_report_ms'].iloc[0] - 1) * 100:.1f}%
+        • Write throughput change: {(write_tp[-1] / write_tp[0] - 1) * 100:.1f}%
+        • Block report change: {(block_report[-1] / block_report[0] - 1) * 100:.1f}%
         """
         ax4.text(0.1, 0.5, summary_text, transform=ax4.transAxes, 
                  fontsize=11, verticalalignment='center', fontfamily='monospace',
                  bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
     
     plt.suptitle('Virtual Storage Scaling Experiment Results', fontsize=14, fontweight='bold')
-    plt.tight_layout()
     
-    output_file = output_dir / "storage_dirs_results.png"
-    plt.savefig(output_file, dpi=150, bbox_inches='tight')
-    print(f"Plot saved to: {output_file}")
-    plt.savefig(output_dir / "storage_dirs_results.pdf", bbox_inches='tight')
+    save_figure(fig, output_dir / f"{prefix}storage_dirs_results.png",
+                output_dir / f"{prefix}storage_dirs_results.pdf")
 
 
-def plot_block_scaling(df, output_dir):
+def plot_block_scaling(df, output_dir, prefix=''):
     """Plot block count scaling results."""
-    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+    fig, axes = plt.subplots(2, 2, figsize=(14, 10), constrained_layout=True)
+    
+    blocks = df['actual_blocks'].to_numpy()
+    heap = df['heap_mb'].to_numpy()
     
     # Plot 1: Heap vs Blocks
     ax1 = axes[0, 0]
-    ax1.plot(df['actual_blocks'], df['heap_mb'], 'o-', 
+    ax1.plot(blocks, heap, 'o-', 
              color='#E74C3C', linewidth=2, markersize=8)
     ax1.set_xlabel('Block Count')
     ax1.set_ylabel('NameNode Heap (MB)')
@@ -130,18 +203,24 @@ def plot_block_scaling(df, output_dir):
     
     # Add trend line
     if len(df) > 2:
-        z = np.polyfit(df['actual_blocks'], df['heap_mb'], 1)
+        z = np.polyfit(blocks, heap, 1)
         p = np.poly1d(z)
-        ax1.plot(df['actual_blocks'], p(df['actual_blocks']), '--', 
+        # Evaluate on a fixed set of points instead of every sample; they are
+        # log-spaced because the x-axis is, so the fit still draws smoothly
+        x_fit = np.geomspace(max(blocks.min(), 1), blocks.max(), 50)
+        ax1.plot(x_fit, p(x_fit), '--', 
                  color='gray', alpha=0.7, label=f'Trend: {z[0]:.4f} MB/block')
         ax1.legend()
     
     # Plot 2: Memory per Block
     ax2 = axes[0, 1]
-    if 'heap_delta_mb' in df.columns and df['actual_blocks'].iloc[0] > 0:
-        blocks_delta = df['actual_blocks'].diff().fillna(df['actual_blocks'])
-        heap_delta = df['heap_delta_mb'].diff().fillna(df['heap_delta_mb'])
-        bytes_per_block = (heap_delta * 1024 * 1024) / blocks_delta.replace(0, 1)
+    if 'heap_delta_mb' in df.columns and blocks[0] > 0:
+        # Per-step deltas; the first step is measured from zero
+        blocks_delta = np.diff(blocks, prepend=0).astype(np.float64)
+        heap_delta = np.diff(df['heap_delta_mb'].to_numpy(), prepend=0) * (1024.0 * 1024.0)
+        # Steps that added no blocks have no per-block cost: report 0
+        bytes_per_block = np.divide(heap_delta, blocks_delta, out=np.zeros_like(heap_delta),
+                                    where=blocks_delta != 0)
         ax2.bar(range(len(df)), bytes_per_block, color='#3498DB')
         ax2.set_xlabel('Measurement Point')
         ax2.set_ylabel('Bytes per Block (estimate)')
@@ -153,10 +232,10 @@ def plot_block_scaling(df, output_dir):
     # Plot 3: Latency vs Blocks
     ax3 = axes[1, 0]
     if 'ls_latency_ms' in df.columns:
-        ax3.plot(df['actual_blocks'], df['ls_latency_ms'], 'o-', 
+        ax3.plot(blocks, df['ls_latency_ms'].to_numpy(), 'o-', 
                  label='ls -R', color='#2ECC71', linewidth=2, markersize=8)
     if 'fsck_latency_ms' in df.columns:
-        ax3.plot(df['actual_blocks'], df['fsck_latency_ms'], 's-', 
+        ax3.plot(blocks, df['fsck_latency_ms'].to_numpy(), 's-', 
                  label='fsck', color='#F39C12', linewidth=2, markersize=8)
     ax3.set_xlabel('Block Count')
     ax3.set_ylabel('Latency (ms)')
@@ -172,8 +251,8 @@ def plot_block_scaling(df, output_dir):
     # Calculate projections
     if len(df) > 1:
         # Estimate bytes per block
-        total_heap_delta = df['heap_mb'].iloc[-1] - df['heap_mb'].iloc[0]
-        total_block_delta = df['actual_blocks'].iloc[-1] - df['actual_blocks'].iloc[0]
+        total_heap_delta = heap[-1] - heap[0]
+        total_block_delta = blocks[-1] - blocks[0]
         if total_block_delta > 0:
             bytes_per_block_avg = (total_heap_delta * 1024 * 1024) / total_block_delta
         else:
@@ -189,8 +268,8 @@ def plot_block_scaling(df, output_dir):
         Block Scaling Analysis
         ─────────────────────────────────
         
-        Measured range: {df['actual_blocks'].min():,} to {df['actual_blocks'].max():,} blocks
-        Memory growth: {df['heap_mb'].iloc[0]}MB → {df['heap_mb'].iloc[-1]}MB
+        Measured range: {blocks.min():,} to {blocks.max():,} blocks
+        Memory growth: {heap[0]}MB → {heap[-1]}MB
         
         Estimated memory per block: ~{bytes_per_block_avg:.0f} bytes
         
@@ -206,27 +285,48 @@ def plot_block_scaling(df, output_dir):
                  bbox=dict(boxstyle='round', facecolor='lightblue', alpha=0.5))
     
     plt.suptitle('Block Count Scaling Experiment Results', fontsize=14, fontweight='bold')
-    plt.tight_layout()
     
-    output_file = output_dir / "block_scaling_results.png"
-    plt.savefig(output_file, dpi=150, bbox_inches='tight')
-    print(f"Plot saved to: {output_file}")
-    plt.savefig(output_dir / "block_scaling_results.pdf", bbox_inches='tight')
+    save_figure(fig, output_dir / f"{prefix}block_scaling_results.png",
+                output_dir / f"{prefix}block_scaling_results.pdf")
 
 
-def plot_memory_monitor(df, output_dir):
+def _minmax_envelope(x, values, stride):
+    """Reduce (x, values) to the min and max of each stride-sample bucket.
+
+    The pair is interleaved at the bucket's first x, so plotting the result as
+    one line draws a vertical stroke per bucket spanning every peak and trough,
+    which is how the full-resolution line looks at that width. stride 1
+    returns the inputs unchanged.
+    """
+    if stride == 1:
+        return x, values
+    starts = np.arange(0, len(values), stride)
+    envelope = np.column_stack([np.minimum.reduceat(values, starts),
+                                np.maximum.reduceat(values, starts)])
+    return np.repeat(x[starts], 2), envelope.ravel()
+
+
+def plot_memory_monitor(df, output_dir, prefix=''):
     """Plot NameNode memory monitoring over time."""
-    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+    fig, axes = plt.subplots(2, 2, figsize=(14, 10), constrained_layout=True)
     
     # Parse timestamp if needed
     if 'timestamp' in df.columns:
         df['time_idx'] = range(len(df))
     
+    # Long runs have far more samples than pixels: plot the min/max envelope
+    # of about one bucket per pixel column, so peaks survive (the summary
+    # below still uses every sample).
+    target_pts = int(fig.get_size_inches()[0] * fig.dpi)
+    stride = len(df) // target_pts if len(df) > 2 * target_pts else 1
+    sample_idx = df['time_idx'].to_numpy()
+    
     # Plot 1: Heap over time
     ax1 = axes[0, 0]
-    ax1.plot(df['time_idx'], df['heap_used_mb'], '-', 
+    time_idx, heap_used = _minmax_envelope(sample_idx, df['heap_used_mb'].to_numpy(), stride)
+    ax1.plot(time_idx, heap_used, '-', 
              color='#E74C3C', linewidth=1.5)
-    ax1.fill_between(df['time_idx'], df['heap_used_mb'], alpha=0.3, color='#E74C3C')
+    ax1.fill_between(time_idx, heap_used, alpha=0.3, color='#E74C3C')
     ax1.set_xlabel('Sample')
     ax1.set_ylabel('Heap Used (MB)')
     ax1.set_title('NameNode Heap Usage Over Time')
@@ -234,7 +334,8 @@ def plot_memory_monitor(df, output_dir):
     
     # Plot 2: Heap percentage
     ax2 = axes[0, 1]
-    ax2.plot(df['time_idx'], df['heap_pct'], '-', color='#9B59B6', linewidth=1.5)
+    ax2.plot(*_minmax_envelope(sample_idx, df['heap_pct'].to_numpy(), stride), '-',
+             color='#9B59B6', linewidth=1.5)
     ax2.axhline(y=80, color='orange', linestyle='--', label='Warning (80%)')
     ax2.axhline(y=95, color='red', linestyle='--', label='Critical (95%)')
     ax2.set_xlabel('Sample')
@@ -247,7 +348,7 @@ def plot_memory_monitor(df, output_dir):
     # Plot 3: Block count over time
     ax3 = axes[1, 0]
     if 'block_count' in df.columns:
-        ax3.plot(df['time_idx'], df['block_count'], '-', 
+        ax3.plot(*_minmax_envelope(sample_idx, df['block_count'].to_numpy(), stride), '-', 
                  color='#3498DB', linewidth=1.5)
         ax3.set_ylabel('Block Count')
     ax3.set_xlabel('Sample')
@@ -258,6 +359,12 @@ def plot_memory_monitor(df, output_dir):
     ax4 = axes[1, 1]
     ax4.axis('off')
     
+    # All summary aggregates in one agg call
+    heap_stats = df['heap_used_mb'].agg(['min', 'max', 'mean'])
+    heap_pct_max = df['heap_pct'].max()
+    block_count = df['block_count'].to_numpy()
+    block_start, block_end = block_count[0], block_count[-1]
+    
     summary_text = f"""
     NameNode Memory Monitoring Summary
     ─────────────────────────────────
@@ -265,59 +372,104 @@ def plot_memory_monitor(df, output_dir):
     Duration: {len(df)} samples
     
     Heap Usage:
-    • Min: {df['heap_used_mb'].min():.0f} MB
-    • Max: {df['heap_used_mb'].max():.0f} MB
-    • Avg: {df['heap_used_mb'].mean():.0f} MB
-    • Max %: {df['heap_pct'].max():.1f}%
+    • Min: {heap_stats['min']:.0f} MB
+    • Max: {heap_stats['max']:.0f} MB
+    • Avg: {heap_stats['mean']:.0f} MB
+    • Max %: {heap_pct_max:.1f}%
     
     Block Count:
-    • Start: {df['block_count'].iloc[0]:,}
-    • End: {df['block_count'].iloc[-1]:,}
-    • Delta: {df['block_count'].iloc[-1] - df['block_count'].iloc[0]:,}
+    • Start: {block_start:,}
+    • End: {block_end:,}
+    • Delta: {block_end - block_start:,}
     """
     ax4.text(0.1, 0.5, summary_text, transform=ax4.transAxes, 
              fontsize=11, verticalalignment='center', fontfamily='monospace',
              bbox=dict(boxstyle='round', facecolor='lightyellow', alpha=0.5))
     
     plt.suptitle('NameNode Memory Monitoring', fontsize=14, fontweight='bold')
-    plt.tight_layout()
     
-    output_file = output_dir / "memory_monitor_results.png"
-    plt.savefig(output_file, dpi=150, bbox_inches='tight')
-    print(f"Plot saved to: {output_file}")
+    save_figure(fig, output_dir / f"{prefix}memory_monitor_results.png")
 
 
-def main():
-    if len(sys.argv) < 2:
-        print("Usage: python3 plot-storage-virtualization.py <csv_file> [output_dir]")
-        sys.exit(1)
+def render_csv(csv_file, output_dir=None, skip_unchanged=False, prefix=''):
+    """Detect the experiment type of one CSV and plot it. Returns False if unknown.
+
+    prefix is prepended to the output file names (<prefix><type>_results.png).
+    """
+    _lazy_imports()  # no-op when already imported; needed in worker processes
+    if output_dir is None:
+        output_dir = csv_file.parent
     
-    csv_file = Path(sys.argv[1])
-    if not csv_file.exists():
-        print(f"Error: File not found: {csv_file}")
-        sys.exit(1)
+    # Detect experiment type from the header, then read only the needed columns
+    header = pd.read_csv(csv_file, nrows=0)
+    exp_type = detect_experiment_type(header)
+    print(f"Detected experiment type: {exp_type}")
     
-    output_dir = Path(sys.argv[2]) if len(sys.argv) > 2 else csv_file.parent
+    if exp_type == 'unknown':
+        print(f"Unknown experiment type. Columns: {list(header.columns)}")
+        return False
     
-    # Read data
-    df = pd.read_csv(csv_file)
-    print(f"Loaded {len(df)} rows from {csv_file}")
+    output_file = output_dir / f"{prefix}{exp_type}_results.png"
+    if skip_unchanged and is_up_to_date(output_file, csv_file):
+        print(f"{output_file} is up to date, skipping (drop --skip-unchanged to regenerate)")
+        return True
     
-    # Detect experiment type and plot
-    exp_type = detect_experiment_type(df)
-    print(f"Detected experiment type: {exp_type}")
+    df = read_csv_cached(csv_file, PLOT_COLUMNS[exp_type])
+    print(f"Loaded {len(df)} rows from {csv_file}")
     
     if exp_type == 'storage_dirs':
-        plot_storage_dirs(df, output_dir)
+        plot_storage_dirs(df, output_dir, prefix)
     elif exp_type == 'block_scaling':
-        plot_block_scaling(df, output_dir)
+        plot_block_scaling(df, output_dir, prefix)
     elif exp_type == 'memory_monitor':
-        plot_memory_monitor(df, output_dir)
-    else:
-        print(f"Unknown experiment type. Columns: {list(df.columns)}")
+        plot_memory_monitor(df, output_dir, prefix)
+    return True
+
+
+def main():
+    args = sys.argv[1:]
+    skip_unchanged = '--skip-unchanged' in args
+    args = [arg for arg in args if arg != '--skip-unchanged']
+    if not args:
+        print("Usage: python3 plot-storage-virtualization.py [--skip-unchanged] <csv_file>... [output_dir]")
         sys.exit(1)
     
-    plt.show()
+    # A trailing argument that is not a CSV file is the output directory
+    output_dir = None
+    if len(args) > 1 and not args[-1].endswith('.csv'):
+        output_dir = Path(args.pop())
+    
+    csv_files = [Path(arg) for arg in args]
+    for csv_file in csv_files:
+        if not csv_file.exists():
+            print(f"Error: File not found: {csv_file}")
+            sys.exit(1)
+    
+    _lazy_imports()
+    
+    if len(csv_files) == 1:
+        ok = [render_csv(csv_files[0], output_dir, skip_unchanged)]
+    else:
+        # Several CSVs may share an experiment type (and an output directory),
+        # so name each CSV's plots after it and refuse inputs that still collide
+        targets = {}
+        for csv_file in csv_files:
+            target = ((output_dir or csv_file.parent).resolve(), csv_file.stem)
+            if target in targets:
+                print(f"Error: {csv_file} and {targets[target]} would write the same plots "
+                      f"in {target[0]}")
+                sys.exit(1)
+            targets[target] = csv_file
+        prefixes = [f"{csv_file.stem}_" for csv_file in csv_files]
+        
+        # Each figure is independent and CPU-bound in Agg, so render in parallel
+        workers = min(len(csv_files), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            ok = list(executor.map(render_csv, csv_files, repeat(output_dir),
+                                   repeat(skip_unchanged), prefixes))
+    
+    if not all(ok):
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -4,33 +4,43 @@ DESCRIPTION: Analyzes the results of multiple WordCount runs and provides a summ
 USAGE: python analyze.py
 PREREQUISITES:
     - WordCount experiment results available in the results directory.
+    - numpy installed (pip install numpy)
 OUTPUT:
     - Total runs, mean runtime, and standard deviation of runtimes.
 """
 
-import glob
-from statistics import mean, stdev
+import os
+from pathlib import Path
+
+import numpy as np
 
 BASE = "/home/mostufa.j/my_scripts/results/wordcount"
 
-runs = sorted(glob.glob(f"{BASE}/*"))
-times = []
+# scandir's DirEntry carries the file type, so is_dir() needs no extra stat
+try:
+    with os.scandir(BASE) as entries:
+        runs = sorted(entry.path for entry in entries if entry.is_dir())
+except FileNotFoundError:
+    runs = []  # no results directory yet: report zero runs
 
+runtimes = []
 for run in runs:
+    # Open directly instead of stat'ing first; a missing file is the exception
     try:
-        with open(f"{run}/runtime_seconds.txt") as f:
-            times.append(float(f.read().strip()))
+        runtimes.append(float(Path(run, "runtime_seconds.txt").read_text()))
     except FileNotFoundError:
         print(f"Warning: runtime_seconds.txt not found in {run}")
 
+times = np.array(runtimes, dtype=np.float64)
+
 print("========================================")
 print("WordCount Experiment Summary")
 print("========================================")
-print(f"Total runs: {len(times)}")
+print(f"Total runs: {times.size}")
 
-if times:
-    print(f"Mean runtime: {mean(times):.2f} sec")
-    if len(times) > 1:
-        print(f"Std deviation: {stdev(times):.2f} sec")
+if times.size:
+    print(f"Mean runtime: {times.mean():.2f} sec")
+    if times.size > 1:
+        print(f"Std deviation: {times.std(ddof=1):.2f} sec")
 
 print("========================================")
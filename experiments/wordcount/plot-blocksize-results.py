@@ -4,9 +4,11 @@ SCRIPT: plot-blocksize-results.py
 DESCRIPTION: Plots WordCount runtime as a function of HDFS block size.
              Creates a figure showing how block size affects MapReduce performance.
              Supports both old and new CSV formats, and can compare multiple runs.
-USAGE: python3 plot-blocksize-results.py [csv_file_or_run_dir]
+USAGE: python3 plot-blocksize-results.py [--skip-unchanged] [csv_file_or_run_dir]
+       With --skip-unchanged, an existing plot newer than both the CSV and
+       this script is kept instead of being re-rendered.
 PREREQUISITES:
-    - matplotlib and pandas installed (pip install matplotlib pandas)
+    - matplotlib, pandas and numpy installed (pip install matplotlib pandas numpy)
     - Benchmark results from benchmark-blocksize.sh
 OUTPUT:
     - Plot image saved next to the CSV file
@@ -20,11 +22,14 @@ from pathlib import Path
 # Try to import required libraries
 try:
     import pandas as pd
+    import matplotlib
+    matplotlib.use('Agg')  # figures are only saved to disk
     import matplotlib.pyplot as plt
     import matplotlib.ticker as ticker
+    import numpy as np
 except ImportError as e:
     print(f"Missing required library: {e}")
-    print("Install with: pip install matplotlib pandas")
+    print("Install with: pip install matplotlib pandas numpy")
     sys.exit(1)
 
 
@@ -68,9 +73,37 @@ def find_csv_file(arg=None):
     return None
 
 
+def block_size_exponent(block_bytes):
+    """Return floor(log2(block_bytes)) per element, or 0 for non-positive sizes."""
+    block_bytes = np.asarray(block_bytes, dtype=np.float64)
+    positive = block_bytes > 0
+    exponents = np.floor(np.log2(np.where(positive, block_bytes, 1)))
+    return np.where(positive, exponents, 0).astype(int)
+
+
+def _format_cells(series):
+    """Format one column's values as strings; missing values become empty cells."""
+    if pd.api.types.is_float_dtype(series):
+        # Same significant digits for every cell, instead of repr's full float noise
+        return ["" if np.isnan(value) else f"{value:.6g}" for value in series.tolist()]
+    return ["" if pd.isna(value) else str(value) for value in series.tolist()]
+
+
+def format_table(df):
+    """Render df as right-aligned text columns, without pandas' repr machinery."""
+    columns = [[str(name), *_format_cells(df[name])] for name in df.columns]
+    widths = [max(map(len, column)) for column in columns]
+    return "\n".join(
+        "  ".join(cell.rjust(width) for cell, width in zip(row, widths))
+        for row in zip(*columns)
+    )
+
+
 def main():
     # Determine CSV file path
-    arg = sys.argv[1] if len(sys.argv) > 1 else None
+    skip_unchanged = '--skip-unchanged' in sys.argv[1:]
+    args = [arg for arg in sys.argv[1:] if arg != '--skip-unchanged']
+    arg = args[0] if args else None
     csv_file = find_csv_file(arg)
     
     if csv_file is None:
@@ -91,17 +124,14 @@ def main():
     
     if 'block_size_exp' not in df.columns and 'block_size_kb' not in df.columns and 'block_size_bytes' in df.columns:
         # Old format - add exponent column (approximate)
-        import math
-        df['block_size_exp'] = df['block_size_bytes'].apply(lambda x: int(math.log2(x)) if x > 0 else 0)
+        df['block_size_exp'] = block_size_exponent(df['block_size_bytes'].to_numpy())
     elif 'block_size_kb' in df.columns:
         # Intermediate format with KB
-        import math
-        df['block_size_exp'] = (df['block_size_kb'] * 1024).apply(lambda x: int(math.log2(x)) if x > 0 else 0)
+        df['block_size_exp'] = block_size_exponent(df['block_size_kb'].to_numpy() * 1024)
     
-    # Filter out error/skipped rows
-    df = df[~df['runtime_seconds'].isin(['ERROR', 'SKIPPED'])]
-    df['runtime_seconds'] = pd.to_numeric(df['runtime_seconds'], errors='coerce')
-    df = df.dropna(subset=['runtime_seconds'])
+    # Filter out error/skipped rows (anything non-numeric, e.g. ERROR or SKIPPED)
+    runtimes = pd.to_numeric(df['runtime_seconds'], errors='coerce')
+    df = df.assign(runtime_seconds=runtimes).dropna(subset=['runtime_seconds'])
     df['block_size_bytes'] = df['block_size_bytes'].astype(int)
     
     if df.empty:
@@ -118,22 +148,33 @@ def main():
     print(f"\nRuntime range: {df['runtime_seconds'].min():.1f}s to {df['runtime_seconds'].max():.1f}s")
     
     # Find optimal block size
-    min_idx = df['runtime_seconds'].idxmin()
-    optimal = df.loc[min_idx]
-    print(f"\nOptimal block size: {optimal['block_size_human']} ({optimal['runtime_seconds']:.1f}s)")
+    best = int(df['runtime_seconds'].to_numpy().argmin())
+    optimal_human = df['block_size_human'].iloc[best]
+    optimal_runtime = df['runtime_seconds'].iloc[best]
+    optimal_bytes = df['block_size_bytes'].iloc[best]
+    print(f"\nOptimal block size: {optimal_human} ({optimal_runtime:.1f}s)")
     
     # Show formula if available
     if 'block_size_formula' in df.columns:
-        print(f"  Formula: {optimal['block_size_formula']} = {optimal['block_size_bytes']} bytes")
+        print(f"  Formula: {df['block_size_formula'].iloc[best]} = {optimal_bytes} bytes")
     elif 'block_size_exp' in df.columns:
-        print(f"  Formula: 2^{int(optimal['block_size_exp'])} = {optimal['block_size_bytes']} bytes")
+        print(f"  Formula: 2^{int(df['block_size_exp'].iloc[best])} = {optimal_bytes} bytes")
     
     print("\n" + "-" * 60)
     print("Detailed Results:")
     print("-" * 60)
-    print(df.to_string(index=False))
+    print(format_table(df))
     print("=" * 60)
     
+    # Determine output filename based on input location
+    run_name = output_dir.name if output_dir.name.startswith("run_") else "blocksize"
+    output_file = output_dir / f"wordcount-blocksize-{run_name}.png"
+    if skip_unchanged and output_file.exists():
+        output_mtime = output_file.stat().st_mtime
+        if output_mtime > csv_file.stat().st_mtime and output_mtime > Path(__file__).stat().st_mtime:
+            print(f"\nPlot is up to date: {output_file} (drop --skip-unchanged to regenerate)")
+            return
+    
     # Create the plot
     fig, ax1 = plt.subplots(figsize=(12, 7))
     
@@ -172,10 +213,10 @@ def main():
         ax1.legend(loc='upper right', fontsize=10)
     
     # Mark optimal point
-    ax1.axvline(x=optimal['block_size_bytes'] / (1024 * 1024), 
+    ax1.axvline(x=optimal_bytes / (1024 * 1024), 
                 color='green', linestyle=':', alpha=0.7, linewidth=2)
-    ax1.annotate(f"Optimal: {optimal['block_size_human']}\n({optimal['runtime_seconds']:.1f}s)",
-                 xy=(optimal['block_size_bytes'] / (1024 * 1024), optimal['runtime_seconds']),
+    ax1.annotate(f"Optimal: {optimal_human}\n({optimal_runtime:.1f}s)",
+                 xy=(optimal_bytes / (1024 * 1024), optimal_runtime),
                  xytext=(10, 30), textcoords='offset points',
                  fontsize=10, color='green',
                  arrowprops=dict(arrowstyle='->', color='green', alpha=0.7))
@@ -189,19 +230,15 @@ def main():
     plt.tight_layout()
     
     # Save figure
-    # Determine output filename based on input location
-    run_name = output_dir.name if output_dir.name.startswith("run_") else "blocksize"
-    output_file = output_dir / f"wordcount-blocksize-{run_name}.png"
-    plt.savefig(output_file, dpi=150, bbox_inches='tight')
+    # Compute the tight bbox once and reuse it for both formats
+    bbox = fig.get_tightbbox(fig.canvas.get_renderer()).padded(0.1)
+    fig.savefig(output_file, dpi=150, bbox_inches=bbox)
     print(f"\nPlot saved to: {output_file}")
     
     # Also save as PDF for higher quality
     pdf_file = output_dir / f"wordcount-blocksize-{run_name}.pdf"
-    plt.savefig(pdf_file, bbox_inches='tight')
+    fig.savefig(pdf_file, bbox_inches=bbox)
     print(f"PDF saved to: {pdf_file}")
-    
-    # Show plot
-    plt.show()
 
 
 if __name__ == "__main__":
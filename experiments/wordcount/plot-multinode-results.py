@@ -6,6 +6,10 @@ Generates multiple visualizations:
 1. Combined chart with all node counts as different lines (with error bars)
 2. Separate charts for each node count
 3. Heatmap of runtime vs nodes vs block size
+4. Speedup relative to the 2-node configuration
+
+With --mode dashboard, the combined chart, heatmap, speedup chart and a
+best-block-size summary are rendered as one 2x2 dashboard.png instead.
 
 CSV format (produced by benchmark-multinode-blocksize.sh):
   node_count,block_size_exp,block_size_bytes,block_size_human,avg_runtime_seconds,stddev_runtime,individual_runtimes
@@ -13,235 +17,399 @@ CSV format (produced by benchmark-multinode-blocksize.sh):
 Usage:
     python3 plot-multinode-results.py <results_directory>
     python3 plot-multinode-results.py results/multinode-benchmark/latest
+    python3 plot-multinode-results.py --mode dashboard <results_directory>
 """
 
 import argparse
-import csv
 import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import cycle, repeat
 from pathlib import Path
 
 try:
+    import matplotlib
+    matplotlib.use('Agg')  # figures are only saved to disk
     import matplotlib.pyplot as plt
-    import matplotlib.cm as cm
+    from matplotlib.collections import LineCollection
+    from matplotlib.lines import Line2D
     import numpy as np
+    import pandas as pd
 except ImportError as exc:
     raise SystemExit(
-        "matplotlib and numpy are required. Install with:\n"
-        "  pip install matplotlib numpy"
+        "matplotlib, numpy and pandas are required. Install with:\n"
+        "  pip install matplotlib numpy pandas"
     ) from exc
 
+# Let Agg simplify near-collinear path segments and draw long paths in chunks
+plt.rcParams['path.simplify'] = True
+plt.rcParams['path.simplify_threshold'] = 1.0
+plt.rcParams['agg.path.chunksize'] = 10000
+
+# Internal benchmark plots: skip PNG optimisation, use fast zlib compression
+# and leave out the Software metadata chunk.
+SAVEFIG_KWARGS = {
+    'dpi': 150,
+    'metadata': {'Software': None},
+    'pil_kwargs': {'optimize': False, 'compress_level': 1},
+}
+
+
+RESULT_COLUMNS = {'node_count', 'block_size_bytes', 'block_size_human',
+                  'avg_runtime_seconds', 'runtime_seconds', 'stddev_runtime'}
+# Block size labels repeat for every node count; keep their CSV row order
+# for the x-axis (the category table itself is sorted lexicographically).
+RESULT_DTYPES = {'node_count': 'int16', 'block_size_human': 'category'}
+
+
+def _read_results_frame(csv_path: Path):
+    """Parse a results CSV into block_size_human, avg_runtime and stddev columns.
+
+    Rows whose runtime is not numeric are dropped; a missing or invalid
+    stddev counts as 0. Runtimes are float32, node counts int16 and block
+    size labels categorical.
+    """
+    df = pd.read_csv(csv_path, usecols=lambda column: column in RESULT_COLUMNS,
+                     dtype=RESULT_DTYPES)
+    # Fallback for old single-run CSV format
+    runtime_column = 'avg_runtime_seconds' if 'avg_runtime_seconds' in df.columns else 'runtime_seconds'
+    # Runtime columns may hold ERROR/SKIPPED markers, so coerce then downcast
+    df['avg_runtime'] = pd.to_numeric(df[runtime_column], errors='coerce', downcast='float')
+    if 'stddev_runtime' in df.columns:
+        df['stddev'] = pd.to_numeric(df['stddev_runtime'], errors='coerce',
+                                     downcast='float').fillna(0.0)
+    else:
+        df['stddev'] = np.float32(0.0)
+    return df.dropna(subset=['avg_runtime'])
+
+
+def _as_arrays(df):
+    """Return the (block_sizes, avg_runtimes, stddevs) column arrays of df."""
+    return (df['block_size_human'].to_numpy(), df['avg_runtime'].to_numpy(),
+            df['stddev'].to_numpy())
+
+
+def _read_results_frame_cached(csv_path: Path):
+    """Like _read_results_frame, via a Parquet sidecar while it is current.
+
+    The parsed frame (already typed and filtered) is written next to the CSV
+    and reused while it is newer than both the CSV and this script, so a
+    change to the parsing or column set here invalidates it. Parquet support
+    needs pyarrow or fastparquet; without either this just parses the CSV.
+    """
+    cache_path = csv_path.with_suffix('.parquet')
+    cache_mtime = cache_path.stat().st_mtime if cache_path.exists() else None
+    if (cache_mtime is not None and cache_mtime >= csv_path.stat().st_mtime
+            and cache_mtime > Path(__file__).stat().st_mtime):
+        try:
+            return pd.read_parquet(cache_path)
+        except (ImportError, OSError, ValueError):
+            pass  # no engine or unreadable cache: fall back to the CSV
+    
+    df = _read_results_frame(csv_path)
+    df = df[df.columns.intersection(['node_count', 'block_size_bytes', 'block_size_human',
+                                     'avg_runtime', 'stddev'], sort=False)]
+    # Write to a temporary name and rename, so an interrupted write never
+    # leaves a truncated cache in place
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        df.to_parquet(tmp_path, compression='zstd')
+        os.replace(tmp_path, cache_path)
+    except (ImportError, OSError):
+        pass  # caching is best-effort
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    return df
+
+
+def _block_size_order(df):
+    """Return every block size label in df once, smallest block first.
+
+    Files without block_size_bytes keep the CSV row order.
+    """
+    if 'block_size_bytes' in df.columns:
+        df = df.sort_values('block_size_bytes', kind='stable')
+    return df['block_size_human'].drop_duplicates().to_numpy()
+
 
 def read_combined_results(csv_path: Path):
-    """Read the combined results CSV with averaged data."""
-    results = {}  # {node_count: [(block_size_human, avg_runtime, stddev), ...]}
-    
-    with csv_path.open() as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            node_count = int(row['node_count'])
-            block_size_human = row['block_size_human']
-            try:
-                avg_runtime = float(row['avg_runtime_seconds'])
-            except (ValueError, KeyError):
-                # Fallback for old single-run CSV format
-                try:
-                    avg_runtime = float(row.get('runtime_seconds', '0'))
-                except ValueError:
-                    continue
-            try:
-                stddev = float(row.get('stddev_runtime', '0'))
-            except (ValueError, TypeError):
-                stddev = 0.0
-            
-            if node_count not in results:
-                results[node_count] = []
-            results[node_count].append((block_size_human, avg_runtime, stddev))
-    
-    return results
+    """Read the combined results CSV with averaged data.
+
+    Returns ({node_count: (block_sizes, avg_runtimes, stddevs)}, block_sizes),
+    the dict keyed in ascending node-count order and block_sizes covering
+    every node count. A node count may lack some block sizes (failed or
+    unfinished runs).
+    """
+    df = _read_results_frame_cached(csv_path)
+    results = {int(node_count): _as_arrays(group)
+               for node_count, group in df.groupby('node_count', sort=True)}
+    return results, _block_size_order(df)
 
 
 def read_node_results(csv_path: Path):
     """Read a single node's results CSV."""
-    results = []
-    
-    with csv_path.open() as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            block_size_human = row['block_size_human']
-            try:
-                avg_runtime = float(row['avg_runtime_seconds'])
-            except (ValueError, KeyError):
-                try:
-                    avg_runtime = float(row.get('runtime_seconds', '0'))
-                except ValueError:
-                    continue
-            try:
-                stddev = float(row.get('stddev_runtime', '0'))
-            except (ValueError, TypeError):
-                stddev = 0.0
-            results.append((block_size_human, avg_runtime, stddev))
-    
-    return results
-
-
-def plot_combined(results: dict, output_path: Path):
-    """Create combined chart with all node counts as different lines + error bars."""
-    plt.figure(figsize=(12, 8))
-    
-    colors = cm.viridis(np.linspace(0, 0.8, len(results)))
+    return _as_arrays(_read_results_frame(csv_path))
+
+
+def _align_series(sorted_items: list, block_sizes, field: int):
+    """Stack one field (1 = runtimes, 2 = stddevs) of every series by block size label.
+
+    Returns a (node count, block size) float32 matrix holding NaN wherever a
+    node count has no result for that block size.
+    """
+    column = {block_size: j for j, block_size in enumerate(block_sizes)}
+    matrix = np.full((len(sorted_items), len(block_sizes)), np.nan, dtype=np.float32)
+    for i, (_, data) in enumerate(sorted_items):
+        matrix[i, [column[block_size] for block_size in data[0]]] = data[field]
+    return matrix
+
+
+def _reset_figure(fig, figsize):
+    """Clear the shared figure, resize it and return a fresh single Axes."""
+    fig.clear()
+    fig.set_size_inches(figsize)
+    return fig.add_subplot()
+
+
+def _scatter_markers(ax, xs, series, colors, markers, labels):
+    """Draw the point markers of every series, one scatter per marker shape.
+
+    Returns Line2D legend proxies (line + marker) in series order.
+    """
+    series_markers = np.array(markers)
+    for marker in dict.fromkeys(markers):
+        rows = np.flatnonzero(series_markers == marker)
+        ax.scatter(np.tile(xs, rows.size), series[rows].ravel(), marker=marker, s=100,
+                   c=np.repeat(colors[rows], len(xs), axis=0), zorder=3)
+    return [Line2D([], [], color=color, marker=marker, linewidth=2, markersize=10, label=label)
+            for color, marker, label in zip(colors, markers, labels)]
+
+
+def _plot_combined_on(ax, sorted_items: list, colors, xs, block_sizes: list):
+    """Draw all node counts as different lines + error bars on ax."""
     markers = ['o', 's', '^', 'D', 'v', '<', '>', 'p']
     
-    for idx, (node_count, data) in enumerate(sorted(results.items())):
-        block_sizes = [d[0] for d in data]
-        runtimes = [d[1] for d in data]
-        stddevs = [d[2] for d in data]
-        
-        plt.errorbar(
-            range(len(block_sizes)), runtimes,
-            yerr=stddevs,
-            marker=markers[idx % len(markers)],
-            color=colors[idx],
-            linewidth=2,
-            markersize=10,
-            capsize=4,
-            capthick=1.5,
-            label=f'{node_count} nodes'
-        )
-    
-    # Get block sizes from first result for x-axis labels
-    first_data = list(results.values())[0]
-    block_sizes = [d[0] for d in first_data]
-    
-    plt.xticks(range(len(block_sizes)), block_sizes, rotation=45, ha='right')
-    plt.xlabel('Block Size', fontsize=12)
-    plt.ylabel('Average Runtime (seconds)', fontsize=12)
-    plt.title('WordCount Performance: Block Size vs Runtime\n(20GB Input, K-run Average, Varying Node Count)', fontsize=14)
-    plt.legend(loc='best', fontsize=10)
-    plt.grid(True, alpha=0.3)
-    plt.tight_layout()
-    
-    plt.savefig(output_path, dpi=150)
+    # NaN marks block sizes a node count has no result for; the lines break there
+    runtimes = _align_series(sorted_items, block_sizes, 1)
+    stddevs = _align_series(sorted_items, block_sizes, 2)
+    
+    # All runtime lines as one (series, point, xy) LineCollection
+    segments = np.stack([np.column_stack([xs, series]) for series in runtimes])
+    ax.add_collection(LineCollection(segments, colors=colors, linewidths=2))
+    
+    # Error bars for every point: one vlines call plus one scatter for the caps
+    point_xs = np.tile(xs, len(sorted_items))
+    point_colors = np.repeat(colors, len(xs), axis=0)
+    lower = (runtimes - stddevs).ravel()
+    upper = (runtimes + stddevs).ravel()
+    ax.vlines(point_xs, lower, upper, colors=point_colors, linewidth=2)
+    ax.scatter(np.concatenate([point_xs, point_xs]), np.concatenate([lower, upper]),
+               marker='_', s=64, c=np.concatenate([point_colors, point_colors]),
+               linewidths=1.5)
+    
+    marker_it = cycle(markers)
+    handles = _scatter_markers(ax, xs, runtimes, colors,
+                               [next(marker_it) for _ in sorted_items],
+                               [f'{node_count} nodes' for node_count, _ in sorted_items])
+    ax.autoscale_view()
+    
+    ax.set_xticks(xs)
+    ax.set_xticklabels(block_sizes, rotation=45, ha='right')
+    ax.set_xlabel('Block Size', fontsize=12)
+    ax.set_ylabel('Average Runtime (seconds)', fontsize=12)
+    ax.set_title('WordCount Performance: Block Size vs Runtime\n(20GB Input, K-run Average, Varying Node Count)', fontsize=14)
+    ax.legend(handles=handles, loc='best', fontsize=10)
+    ax.grid(True, alpha=0.3)
+
+
+def plot_combined(fig, sorted_items: list, colors, xs, block_sizes: list,
+                  output_path: Path):
+    """Create combined chart with all node counts as different lines + error bars."""
+    ax = _reset_figure(fig, (12, 8))
+    _plot_combined_on(ax, sorted_items, colors, xs, block_sizes)
+    fig.tight_layout()
+    
+    fig.savefig(output_path, **SAVEFIG_KWARGS)
     print(f"Saved combined chart: {output_path}")
-    plt.close()
-
-
-def plot_individual(results: dict, output_dir: Path):
-    """Create separate charts for each node count."""
-    for node_count, data in sorted(results.items()):
-        plt.figure(figsize=(10, 6))
-        
-        block_sizes = [d[0] for d in data]
-        runtimes = [d[1] for d in data]
-        stddevs = [d[2] for d in data]
-        
-        bars = plt.bar(range(len(block_sizes)), runtimes, yerr=stddevs,
-                       color='steelblue', alpha=0.8, capsize=4)
-        
-        # Add value labels on bars
-        for bar, runtime, sd in zip(bars, runtimes, stddevs):
-            plt.text(
-                bar.get_x() + bar.get_width() / 2,
-                bar.get_height() + sd + max(runtimes) * 0.02,
-                f'{runtime:.1f}s',
-                ha='center',
-                fontsize=9
-            )
-        
-        plt.xticks(range(len(block_sizes)), block_sizes, rotation=45, ha='right')
-        plt.xlabel('Block Size', fontsize=12)
-        plt.ylabel('Average Runtime (seconds)', fontsize=12)
-        plt.title(f'WordCount Performance with {node_count} Nodes\n(20GB Input, K-run Average)', fontsize=14)
-        plt.grid(True, axis='y', alpha=0.3)
-        plt.tight_layout()
-        
-        output_path = output_dir / f'results_{node_count}nodes.png'
-        plt.savefig(output_path, dpi=150)
-        print(f"Saved {node_count}-node chart: {output_path}")
-        plt.close()
-
-
-def plot_heatmap(results: dict, output_path: Path):
+
+
+def _render_single(node_count, xs, block_sizes, runtimes, stddevs, output_dir: Path):
+    """Render the bar chart for one node count and return its path (runs in a worker process)."""
+    fig, ax = plt.subplots(figsize=(10, 6))
+    
+    bars = ax.bar(xs, runtimes, yerr=stddevs,
+                  color='steelblue', alpha=0.8, capsize=4)
+    
+    # Add value labels on bars (placed above the error bars)
+    ax.bar_label(bars, labels=[f'{runtime:.1f}s' for runtime in runtimes],
+                 padding=3, fontsize=9)
+    
+    ax.set_xticks(xs)
+    ax.set_xticklabels(block_sizes, rotation=45, ha='right')
+    ax.set_xlabel('Block Size', fontsize=12)
+    ax.set_ylabel('Average Runtime (seconds)', fontsize=12)
+    ax.set_title(f'WordCount Performance with {node_count} Nodes\n(20GB Input, K-run Average)', fontsize=14)
+    ax.grid(True, axis='y', alpha=0.3)
+    fig.tight_layout()
+    
+    output_path = output_dir / f'results_{node_count}nodes.png'
+    fig.savefig(output_path, **SAVEFIG_KWARGS)
+    plt.close(fig)
+    return output_path
+
+
+def plot_individual(sorted_items: list, output_dir: Path):
+    """Create separate charts for each node count, in parallel across CPU cores."""
+    node_counts = [node_count for node_count, _ in sorted_items]
+    block_sizes, runtimes, stddevs = zip(*(data for _, data in sorted_items))
+    # Each chart shows only the block sizes its node count has results for
+    positions = [np.arange(len(sizes)) for sizes in block_sizes]
+    args = (node_counts, positions, block_sizes, runtimes, stddevs, repeat(output_dir))
+    workers = min(len(sorted_items), os.cpu_count() or 1)
+    if workers == 1:
+        # One chart (or one core): spawning a pool only adds startup cost
+        output_paths = map(_render_single, *args)
+        for node_count, output_path in zip(node_counts, output_paths):
+            print(f"Saved {node_count}-node chart: {output_path}")
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        output_paths = executor.map(_render_single, *args)
+        # Report from the parent, in node-count order, so worker output cannot interleave
+        for node_count, output_path in zip(node_counts, output_paths):
+            print(f"Saved {node_count}-node chart: {output_path}")
+
+
+def _plot_heatmap_on(ax, sorted_items: list, node_counts: list, xs, block_sizes: list):
+    """Draw the runtime heatmap (nodes x block size) with its colorbar on ax."""
+    # Prepare data matrix (NaN cells, i.e. missing runs, are drawn grey)
+    data_matrix = _align_series(sorted_items, block_sizes, 1)
+    
+    im = ax.imshow(data_matrix, aspect='auto',
+                   cmap=plt.colormaps['RdYlGn_r'].with_extremes(bad='lightgray'))
+    ax.figure.colorbar(im, ax=ax, label='Runtime (seconds)')
+    
+    ax.set_xticks(xs)
+    ax.set_xticklabels(block_sizes, rotation=45, ha='right')
+    ax.set_yticks(range(len(node_counts)))
+    ax.set_yticklabels([f'{n} nodes' for n in node_counts])
+    
+    # Add text annotations (median computed once, not per cell)
+    text_colors = np.where(data_matrix > np.nanmedian(data_matrix), 'white', 'black')
+    for i, j in zip(*np.nonzero(~np.isnan(data_matrix))):
+        ax.text(j, i, f'{data_matrix[i, j]:.0f}s',
+                ha='center', va='center', color=text_colors[i, j], fontsize=9)
+    
+    ax.set_xlabel('Block Size', fontsize=12)
+    ax.set_ylabel('Node Count', fontsize=12)
+    ax.set_title('WordCount Average Runtime Heatmap\n(20GB Input, K-run Average)', fontsize=14)
+
+
+def plot_heatmap(fig, sorted_items: list, node_counts: list, xs, block_sizes: list,
+                 output_path: Path):
     """Create a heatmap showing average runtime vs nodes and block size."""
-    # Prepare data matrix
-    node_counts = sorted(results.keys())
-    block_sizes = [d[0] for d in list(results.values())[0]]
-    
-    data_matrix = np.zeros((len(node_counts), len(block_sizes)))
-    
-    for i, node_count in enumerate(node_counts):
-        for j, (_, avg_runtime, _) in enumerate(results[node_count]):
-            data_matrix[i, j] = avg_runtime
+    ax = _reset_figure(fig, (12, 6))
+    _plot_heatmap_on(ax, sorted_items, node_counts, xs, block_sizes)
+    fig.tight_layout()
     
-    plt.figure(figsize=(12, 6))
-    
-    im = plt.imshow(data_matrix, aspect='auto', cmap='RdYlGn_r')
-    plt.colorbar(im, label='Runtime (seconds)')
-    
-    plt.xticks(range(len(block_sizes)), block_sizes, rotation=45, ha='right')
-    plt.yticks(range(len(node_counts)), [f'{n} nodes' for n in node_counts])
-    
-    # Add text annotations
-    for i in range(len(node_counts)):
-        for j in range(len(block_sizes)):
-            text_color = 'white' if data_matrix[i, j] > np.median(data_matrix) else 'black'
-            plt.text(j, i, f'{data_matrix[i, j]:.0f}s',
-                     ha='center', va='center', color=text_color, fontsize=9)
-    
-    plt.xlabel('Block Size', fontsize=12)
-    plt.ylabel('Node Count', fontsize=12)
-    plt.title('WordCount Average Runtime Heatmap\n(20GB Input, K-run Average)', fontsize=14)
-    plt.tight_layout()
-    
-    plt.savefig(output_path, dpi=150)
+    fig.savefig(output_path, **SAVEFIG_KWARGS)
     print(f"Saved heatmap: {output_path}")
-    plt.close()
 
 
-def plot_speedup(results: dict, output_path: Path):
-    """Plot speedup relative to 2-node configuration."""
+def _speedup_skip_reason(results: dict):
+    """Return why no speedup chart can be drawn, or None if it can."""
     if 2 not in results:
-        print("No 2-node baseline, skipping speedup chart")
-        return
+        return "No 2-node baseline"
+    if len(results) < 2:
+        return "Only the 2-node baseline present"
+    return None
+
+
+def _plot_speedup_on(ax, results: dict, sorted_items: list, colors, xs, block_sizes: list):
+    """Draw the speedup of each node count relative to 2 nodes on ax."""
+    # Baseline runtimes aligned with block_sizes (NaN where the 2-node run is missing one)
+    baseline_arr = _align_series([(2, results[2])], block_sizes, 1)[0]
     
-    baseline = {d[0]: d[1] for d in results[2]}
+    markers = ['o', 's', '^', 'D', 'v']
     
-    plt.figure(figsize=(12, 8))
+    # Every series except the baseline itself, keeping its colour/marker index
+    marker_it = cycle(markers)
+    series, series_markers = [], []
+    for idx, (node_count, _) in enumerate(sorted_items):
+        marker = next(marker_it)
+        if node_count != 2:
+            series.append(idx)
+            series_markers.append(marker)
+    speedups = baseline_arr / _align_series(sorted_items, block_sizes, 1)[series]
+    
+    segments = np.stack([np.column_stack([xs, row]) for row in speedups])
+    ax.add_collection(LineCollection(segments, colors=colors[series], linewidths=2))
+    handles = _scatter_markers(ax, xs, speedups, colors[series], series_markers,
+                               [f'{sorted_items[idx][0]} nodes' for idx in series])
+    ax.autoscale_view()
+    
+    ax.set_xticks(xs)
+    ax.set_xticklabels(block_sizes, rotation=45, ha='right')
+    ax.set_xlabel('Block Size', fontsize=12)
+    ax.set_ylabel('Speedup (relative to 2 nodes)', fontsize=12)
+    ax.set_title('WordCount Speedup Analysis\n(Relative to 2-Node Configuration)', fontsize=14)
+    handles.append(ax.axhline(y=1.0, color='gray', linestyle='--', alpha=0.5, label='Baseline (1x)'))
+    ax.legend(handles=handles, loc='best', fontsize=10)
+    ax.grid(True, alpha=0.3)
+
+
+def plot_speedup(fig, results: dict, sorted_items: list, colors, xs, block_sizes: list,
+                 output_path: Path):
+    """Plot speedup relative to 2-node configuration."""
+    reason = _speedup_skip_reason(results)
+    if reason:
+        print(f"{reason}, skipping speedup chart")
+        return
     
-    colors = cm.viridis(np.linspace(0, 0.8, len(results)))
-    markers = ['o', 's', '^', 'D', 'v']
+    ax = _reset_figure(fig, (12, 8))
+    _plot_speedup_on(ax, results, sorted_items, colors, xs, block_sizes)
+    fig.tight_layout()
     
-    for idx, (node_count, data) in enumerate(sorted(results.items())):
-        if node_count == 2:
-            continue
-        
-        block_sizes = [d[0] for d in data]
-        speedups = [baseline[d[0]] / d[1] for d in data]
-        
-        plt.plot(
-            range(len(block_sizes)), speedups,
-            marker=markers[idx % len(markers)],
-            color=colors[idx],
-            linewidth=2,
-            markersize=10,
-            label=f'{node_count} nodes'
-        )
-    
-    # Ideal speedup lines
-    first_data = list(results.values())[0]
-    block_sizes = [d[0] for d in first_data]
-    
-    plt.xticks(range(len(block_sizes)), block_sizes, rotation=45, ha='right')
-    plt.xlabel('Block Size', fontsize=12)
-    plt.ylabel('Speedup (relative to 2 nodes)', fontsize=12)
-    plt.title('WordCount Speedup Analysis\n(Relative to 2-Node Configuration)', fontsize=14)
-    plt.axhline(y=1.0, color='gray', linestyle='--', alpha=0.5, label='Baseline (1x)')
-    plt.legend(loc='best', fontsize=10)
-    plt.grid(True, alpha=0.3)
-    plt.tight_layout()
-    
-    plt.savefig(output_path, dpi=150)
+    fig.savefig(output_path, **SAVEFIG_KWARGS)
     print(f"Saved speedup chart: {output_path}")
-    plt.close()
+
+
+def _plot_summary_on(ax, sorted_items: list):
+    """Tabulate the best and worst block size of each node count on ax."""
+    rows = []
+    for node_count, (block_sizes, runtimes, stddevs) in sorted_items:
+        best, worst = int(runtimes.argmin()), int(runtimes.argmax())
+        rows.append([f'{node_count}',
+                     f'{block_sizes[best]}', f'{runtimes[best]:.1f} \u00b1 {stddevs[best]:.1f}s',
+                     f'{block_sizes[worst]}', f'{runtimes[worst]:.1f}s'])
+    
+    ax.axis('off')
+    table = ax.table(cellText=rows,
+                     colLabels=['Nodes', 'Best Block Size', 'Best Runtime',
+                                'Worst Block Size', 'Worst Runtime'],
+                     loc='center', cellLoc='center')
+    table.auto_set_font_size(False)
+    table.set_fontsize(11)
+    table.scale(1, 2)
+    ax.set_title('Best Block Size per Node Count', fontsize=14)
+
+
+def plot_dashboard(results: dict, sorted_items: list, node_counts: list, colors, xs,
+                   block_sizes: list, output_path: Path):
+    """Render combined, heatmap, speedup and summary panels into one PNG."""
+    fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(20, 14))
+    _plot_combined_on(ax1, sorted_items, colors, xs, block_sizes)
+    _plot_heatmap_on(ax2, sorted_items, node_counts, xs, block_sizes)
+    reason = _speedup_skip_reason(results)
+    if reason:
+        ax3.axis('off')
+        ax3.text(0.5, 0.5, f'{reason}: no speedup chart', ha='center', va='center', fontsize=12)
+    else:
+        _plot_speedup_on(ax3, results, sorted_items, colors, xs, block_sizes)
+    _plot_summary_on(ax4, sorted_items)
+    fig.tight_layout()
+    
+    fig.savefig(output_path, **SAVEFIG_KWARGS)
+    print(f"Saved dashboard: {output_path}")
+    plt.close(fig)
 
 
 def main():
@@ -253,34 +421,56 @@ def main():
         type=Path,
         help="Path to the results directory (e.g., results/multinode-benchmark/run_...)"
     )
+    parser.add_argument(
+        "--mode",
+        choices=("separate", "dashboard"),
+        default="separate",
+        help="separate: one PNG per chart (default); dashboard: a single 2x2 dashboard.png"
+    )
     args = parser.parse_args()
     
-    results_dir = args.results_dir.resolve()
-    
-    if not results_dir.exists():
-        raise SystemExit(f"Results directory not found: {results_dir}")
-    
+    results_dir = args.results_dir
     combined_csv = results_dir / "all_results.csv"
     
-    if not combined_csv.exists():
+    # One stat on the normal path; the directory is only checked to word the error
+    if not combined_csv.is_file():
+        if not results_dir.is_dir():
+            raise SystemExit(f"Results directory not found: {results_dir}")
         raise SystemExit(f"Combined results CSV not found: {combined_csv}")
     
-    print(f"Reading results from: {results_dir}")
+    print(f"Reading results from: {results_dir.resolve()}")
     print()
     
-    results = read_combined_results(combined_csv)
+    results, block_sizes = read_combined_results(combined_csv)
     
     if not results:
         raise SystemExit("No valid results found in CSV")
     
-    print(f"Found results for {len(results)} node configurations: {sorted(results.keys())}")
+    # results is already keyed in ascending node-count order; share the
+    # derived axes with every plot
+    sorted_items = list(results.items())
+    node_counts = [node_count for node_count, _ in sorted_items]
+    xs = np.arange(len(block_sizes))
+    # One colour per node count, shared by the combined and speedup charts
+    colors = plt.colormaps['viridis'](np.linspace(0, 0.8, len(sorted_items)))
+    
+    print(f"Found results for {len(results)} node configurations: {node_counts}")
     print()
     
-    # Generate all plots
-    plot_combined(results, results_dir / "combined_results.png")
-    plot_individual(results, results_dir)
-    plot_heatmap(results, results_dir / "heatmap.png")
-    plot_speedup(results, results_dir / "speedup.png")
+    if args.mode == "dashboard":
+        plot_dashboard(results, sorted_items, node_counts, colors, xs, block_sizes,
+                       results_dir / "dashboard.png")
+        return
+    
+    # Generate all plots on one reused figure
+    fig = plt.figure()
+    plot_combined(fig, sorted_items, colors, xs, block_sizes,
+                  results_dir / "combined_results.png")
+    plot_individual(sorted_items, results_dir)
+    plot_heatmap(fig, sorted_items, node_counts, xs, block_sizes, results_dir / "heatmap.png")
+    plot_speedup(fig, results, sorted_items, colors, xs, block_sizes,
+                 results_dir / "speedup.png")
+    plt.close(fig)
     
     print()
     print("=" * 50)